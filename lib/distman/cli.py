@@ -42,7 +42,7 @@ import os
 import sys
 
 from distman import Distributor, config, util
-from distman.logger import setup_stream_handler
+from distman.logger import LOG_LEVEL, is_valid_level, log, setup_stream_handler
 
 setup_stream_handler()
 
@@ -139,6 +139,11 @@ def main():
 
     args = parse_args()
 
+    if not is_valid_level(config.LOG_LEVEL):
+        log.warning(
+            "Warning: Unknown log level '%s', using %s", config.LOG_LEVEL, LOG_LEVEL
+        )
+
     if not os.path.isdir(args.location):
         print("%s is not a directory" % args.location)
         return 1
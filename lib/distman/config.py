@@ -56,8 +56,21 @@ DIST_FILE_VERSION = 1
 DIST_INFO_EXT = ".dist"
 DIR_VERSIONS = "versions"
 
+# hard link versioned files instead of symlinking them (same filesystem only)
+PREFER_HARDLINKS = os.getenv("PREFER_HARDLINKS", "0") == "1"
+
+# turn on git's untracked cache in source repos to speed up status calls
+ENABLE_UNTRACKED_CACHE = os.getenv("ENABLE_UNTRACKED_CACHE", "0") == "1"
+
+# maximum number of worker threads for file operations
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# buffer size in bytes for reading and writing files during copy and compare
+IO_BUFFER_SIZE = 1 << 16
+
 # logging settings
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+LOG_LEVEL_DEFAULT = "INFO"
+LOG_LEVEL = os.getenv("LOG_LEVEL", LOG_LEVEL_DEFAULT)
 DRYRUN_MESSAGE = "NOTICE: Dry run (no changes will be made)"
 
 # ignorable files and directories
@@ -77,6 +90,30 @@ IGNORABLE = [
     ".DS_Store",
 ]
 
+# file extensions copied and compared as binary, without line ending conversion
+BINARY_EXTENSIONS = {
+    ".7z",
+    ".bin",
+    ".bmp",
+    ".dll",
+    ".dylib",
+    ".exe",
+    ".gif",
+    ".gz",
+    ".ico",
+    ".jpeg",
+    ".jpg",
+    ".mp4",
+    ".pdf",
+    ".png",
+    ".pyc",
+    ".so",
+    ".tar",
+    ".tgz",
+    ".whl",
+    ".zip",
+}
+
 # git repo settings
 LEN_HASH = 7
 LEN_MINHASH = 4
@@ -35,20 +35,81 @@ Contains file distribution classes and functions.
 
 import filecmp
 import fnmatch
+import functools
 import os
-import shutil
+import re
+import stat
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 
 from distman import config, util
 from distman.logger import log
 from distman.source import GitRepo
 
 
+def _skip_predicate(pattern):
+    """Returns a function that tests if a target name should be skipped,
+    i.e. does not match the wildcard pattern. The pattern is compiled once.
+
+    :param pattern: target name pattern (supports wildcards).
+    :returns: function that takes a target name and returns True to skip.
+    """
+    if not pattern:
+        return lambda name: False
+    match = re.compile(fnmatch.translate(os.path.normcase(pattern))).match
+    return lambda name: match(os.path.normcase(name)) is None
+
+
+def _resolve_dest(dest):
+    """Returns the sanitized destination path with tokens replaced.
+
+    :param dest: Destination path string with tokens.
+    :return: Resolved destination path.
+    """
+    return util.sanitize_path(util.replace_vars(dest))
+
+
+@functools.lru_cache(maxsize=1024)
+def _list_versions_dir(filedir, mtime_ns):
+    """Returns the names of the files in a versions directory. Results are
+    cached on the directory modification time, so every file sharing the
+    versions directory reuses a single listing.
+
+    :param filedir: Path to versions directory.
+    :param mtime_ns: Modification time of filedir in nanoseconds.
+    :return: Tuple of file names.
+    """
+    return tuple(os.listdir(filedir))
+
+
+def _bounded_map(func, argslist):
+    """Generator that runs func over argument tuples on a thread pool, keeping
+    a bounded number of calls in flight, and yields results as they complete.
+    Closing the generator early stops submitting new calls.
+
+    :param func: Callable to run.
+    :param argslist: Iterable of argument tuples.
+    :return: Generator of results, in completion order.
+    """
+    max_pending = config.MAX_WORKERS * 4
+    with ThreadPoolExecutor(config.MAX_WORKERS) as executor:
+        pending = set()
+        for args in argslist:
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+            pending.add(executor.submit(func, *args))
+        for future in as_completed(pending):
+            yield future.result()
+
+
 class Distributor(GitRepo):
     """File distribution class."""
 
     def __init__(self):
         super(Distributor, self).__init__()
+        self.__dist_targets = None
         self.__add_symlink_support()
 
     @staticmethod
@@ -59,21 +120,25 @@ class Distributor(GitRepo):
             util.add_symlink_support()
 
     @staticmethod
-    def __get_file_versions(target):
+    def __get_file_versions(target, filedir=None):
         """Find the highest numeric version number for a file.
 
         :param target: Path to file to check.
+        :param filedir: Optional path to the versions directory of target.
         :return: List of tuples with version number and file.
         """
-        filedir = os.path.dirname(target) + "/" + config.DIR_VERSIONS
-        if not os.path.exists(filedir):
+        if filedir is None:
+            filedir = os.path.dirname(target) + "/" + config.DIR_VERSIONS
+        try:
+            mtime_ns = os.stat(filedir).st_mtime_ns
+        except OSError:
             return []
 
         filename = os.path.basename(target)
         version_list = []
+        file_name_length = len(filename)
 
-        for f in os.listdir(filedir):
-            file_name_length = len(filename)
+        for f in _list_versions_dir(filedir, mtime_ns):
             # get files that match <target>.<version>.<commit>
             if (
                 f.startswith(filename)
@@ -124,32 +189,37 @@ class Distributor(GitRepo):
         :param source: Path to source file or link.
         :param dest: Path to destination.
         """
+        source_mode = None
         try:
-            destdir = os.path.dirname(dest)
-            if not os.path.isdir(destdir):
-                os.makedirs(destdir)
+            source_mode = os.lstat(source).st_mode
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
             # copy link
-            if os.path.islink(source):
+            if stat.S_ISLNK(source_mode):
                 linkto = os.readlink(source)
                 try:
                     os.symlink(linkto, dest, target_is_directory=os.path.isdir(linkto))
                 except OSError as e:
-                    log.error("Failed to create symbolic link: %s" % str(e))
+                    log.error("Failed to create symbolic link: %s", e)
+            # copy known binary files as is
+            elif util.has_binary_extension(source):
+                util.copy_file(source, dest)
             # copy file, converting line endings to LF
             else:
-                with open(source, "r") as infile, open(dest, "wb") as outfile:
+                bufsize = config.IO_BUFFER_SIZE
+                with open(source, "r", buffering=bufsize) as infile, open(
+                    dest, "wb", buffering=bufsize
+                ) as outfile:
                     for line in infile:
                         text = line.rstrip("\r\n")
                         outfile.write((text + "\n").encode("UTF-8"))
         except UnicodeDecodeError:
-            shutil.copy2(source, dest)
+            util.copy_file(source, dest)
         except Exception as e:
-            log.error("File copy error: %s" % str(e))
+            log.error("File copy error: %s", e)
         finally:
             # preserve original file mode if not a link
-            if not os.path.islink(source):
-                mode = os.stat(source).st_mode
-                os.chmod(dest, mode)
+            if source_mode is not None and not stat.S_ISLNK(source_mode):
+                os.chmod(dest, source_mode)
 
     def __copy_directory(self, source, dest):
         """Recursively copies a directory (ignores hidden files).
@@ -160,12 +230,14 @@ class Distributor(GitRepo):
         source = os.path.relpath(source)
         all_files = self.get_files(source)
 
-        for filepath in all_files:
-            if source == ".":
-                target = os.path.join(dest, filepath)
-            else:
-                target = os.path.join(dest, filepath[len(source) + 1 :])
-            self.__copy_file(filepath, target)
+        if source == ".":
+            targets = [os.path.join(dest, f) for f in all_files]
+        else:
+            targets = [os.path.join(dest, f[len(source) + 1 :]) for f in all_files]
+
+        # overlap the per-file copies, errors are logged by __copy_file
+        for _ in _bounded_map(self.__copy_file, zip(all_files, targets)):
+            pass
 
     def __copy_object(self, source, dest):
         """Copies, or links, a file or directory recursively (ignores hidden
@@ -174,12 +246,13 @@ class Distributor(GitRepo):
         :param source: Path to source file, link or directory.
         :param dest: Path to destination file or directory.
         """
-        if os.path.islink(source):
+        source_type = util.get_path_type(source)
+        if source_type == "link":
             link_target = os.readlink(source)
             self.__link_object(link_target, dest, link_target)
-        elif os.path.isfile(source):
+        elif source_type == "file":
             self.__copy_file(source, dest)
-        elif os.path.isdir(source):
+        elif source_type == "directory":
             self.__copy_directory(source, dest)
         else:
             raise Exception("Source '%s' not found" % source)
@@ -193,8 +266,9 @@ class Distributor(GitRepo):
         :return: True if files or links are the same.
         """
         try:
+            source_mode = os.lstat(source).st_mode
             # compare links
-            if os.path.islink(source):
+            if stat.S_ISLNK(source_mode):
                 if os.path.islink(target):
                     return os.readlink(source) == os.readlink(target)
                 else:
@@ -202,10 +276,16 @@ class Distributor(GitRepo):
             # compare files
             else:
                 # file mode must match
-                if os.stat(source).st_mode != os.stat(target).st_mode:
+                if source_mode != os.stat(target).st_mode:
                     return False
+                # known binary files are compared byte for byte
+                if util.has_binary_extension(source):
+                    return filecmp.cmp(source, target, shallow=False)
                 # file contents must match
-                with open(source, "r") as file1, open(target, "r") as file2:
+                bufsize = config.IO_BUFFER_SIZE
+                with open(source, "r", buffering=bufsize) as file1, open(
+                    target, "r", buffering=bufsize
+                ) as file2:
                     while True:
                         line1 = next(file1, None)
                         line2 = next(file2, None)
@@ -219,7 +299,7 @@ class Distributor(GitRepo):
         except UnicodeDecodeError:
             return filecmp.cmp(source, target, shallow=False)
         except IsADirectoryError as err:
-            log.error("Cannot compare source: %s" % err)
+            log.error("Cannot compare source: %s", err)
             return False
         except FileNotFoundError:
             return False
@@ -236,58 +316,97 @@ class Distributor(GitRepo):
 
         path1 = os.path.relpath(path1)
         all_files = self.get_files(path1)
+        dest_files = [os.path.join(path2, f[len(path1) + 1 :]) for f in all_files]
 
-        for filepath in all_files:
-            destPath = os.path.join(path2, filepath[len(path1) + 1 :])
-            if not self.__compare_files(filepath, destPath):
-                return False
-
-        return True
+        # compare files concurrently, stopping at the first difference
+        return all(_bounded_map(self.__compare_files, zip(all_files, dest_files)))
 
     @staticmethod
-    def __link_object(target, link, actual_target):
+    def __link_object(target, link, actual_target, hardlink=False):
         """Creates symbolic link to a file or directory.
 
         :param target: Path to target file or directory.
         :param link: Path to symbolic link.
         :param actual_target: Path to actual target file or directory.
+        :param hardlink: Hard link a versioned file if PREFER_HARDLINKS is set.
         :returns: True if linking was successful.
         """
-        if not os.path.exists(actual_target):
-            log.warning("Target '%s' not found" % actual_target)
+        try:
+            isdir = stat.S_ISDIR(os.stat(actual_target).st_mode)
+        except OSError:
+            log.warning("Target '%s' not found", actual_target)
+            isdir = False
 
-        target_type = util.get_path_type(actual_target)[0]
+        # hard link versioned files if enabled, falls back to symlinks
+        if hardlink and config.PREFER_HARDLINKS and util.link_file(actual_target, link):
+            return True
 
         try:
-            isdir = os.path.isdir(actual_target)
             os.symlink(target, link, target_is_directory=isdir)
 
         except OSError as e:
+            target_type = util.get_path_type(actual_target)[0]
             log.error(
-                "Failed to create symoblic link '%s =%s> %s': %s"
-                % (link, target_type, target, str(e))
+                "Failed to create symoblic link '%s =%s> %s': %s",
+                link,
+                target_type,
+                target,
+                e,
             )
             return False
 
         return True
 
+    def __get_dist_targets(self):
+        """Returns the targets in the dist file that define a source and a
+        destination, with source paths normalized. Destination tokens are
+        left unresolved, see __resolve_target_dest. The list is cached until
+        the dist file is read again.
+
+        :return: List of (name, source, dest) tuples, or None on failure.
+        """
+        if self.__dist_targets is not None:
+            return self.__dist_targets
+
+        targets_node = self.get_targets()
+
+        if targets_node is None:
+            return None
+
+        dist_targets = []
+        for target_name, target_dict in targets_node.items():
+            source = target_dict.get(config.TAG_SOURCEPATH)
+            dest = target_dict.get(config.TAG_DESTPATH)
+            if source is None or dest is None:
+                continue
+            dist_targets.append((target_name, util.normalize_path(source), dest))
+
+        self.__dist_targets = dist_targets
+        return dist_targets
+
     @staticmethod
-    def __replace_vars(pathstr):
-        """Replaces tokens in string with environment variable or config default.
+    def __resolve_target_dest(target_name, dest, log_func=log.info):
+        """Resolves the destination path of a target, logging on failure.
+
+        :param target_name: target name in dist file.
+        :param dest: Destination path string with tokens.
+        :param log_func: Log function used to report a resolution failure.
+        :return: Resolved destination path, or None on failure.
+        """
+        try:
+            return _resolve_dest(dest)
+        except Exception as e:
+            log_func("%s in <%s> for %s", e, config.TAG_DESTPATH, target_name)
+            return None
+
+    def read_dist_file(self, directory="."):
+        """Opens and parses the dist file, clearing cached target info.
 
-        :param pathstr: Path string with tokens.
-        :return: Path string with tokens replaced.
+        :param directory: Path to directory containing the dist file.
+        :return: True if successful.
         """
-        while True:
-            openBracket = pathstr.find(config.PATH_TOKEN_OPEN)
-            closeBracket = pathstr.find(config.PATH_TOKEN_CLOSE)
-            if -1 == openBracket or closeBracket <= openBracket:
-                return pathstr
-            var = pathstr[openBracket + 1 : closeBracket].upper()
-            replacement = os.getenv(var, config.DEFAULT_ENV.get(var))
-            if not replacement:
-                raise Exception("Cannot resolve env var '%s'" % var)
-            pathstr = pathstr[0:openBracket] + replacement + pathstr[closeBracket + 1 :]
+        self.__dist_targets = None
+        return super(Distributor, self).read_dist_file(directory)
 
     def get_files(self, start):
         """Returns the list of files to be disted.
@@ -319,7 +438,7 @@ class Distributor(GitRepo):
         :return: True if successful.
         """
         if self.root is None:
-            log.error("%s not found or invalid" % config.DIST_FILE)
+            log.error("%s not found or invalid", config.DIST_FILE)
             return False
 
         if not self.read_git_info():
@@ -334,30 +453,33 @@ class Distributor(GitRepo):
         changed_dirs = util.get_common_root_dirs(changed_files)
 
         if changed_files and (config.DIST_FILE in changed_files):
-            log.warning("Uncommitted changes in %s" % config.DIST_FILE)
+            log.warning("Uncommitted changes in %s", config.DIST_FILE)
 
         targets = []
+        dest_dirs = set()
+        missing_dirs = []
+        skip = _skip_predicate(target)
         for target_name, target_dict in targets_node.items():
             source = target_dict.get(config.TAG_SOURCEPATH)
             dest = target_dict.get(config.TAG_DESTPATH)
             if source is None or dest is None:
                 log.info(
-                    "Target %s: Missing '%s' or '%s' tag"
-                    % (target_name, config.TAG_SOURCEPATH, config.TAG_DESTPATH)
+                    "Target %s: Missing '%s' or '%s' tag",
+                    target_name,
+                    config.TAG_SOURCEPATH,
+                    config.TAG_DESTPATH,
                 )
                 self.root = None
                 return False
 
             # optionally match on specific targets
-            if target and not fnmatch.fnmatch(target_name, target):
+            if skip(target_name):
                 continue
 
             try:
-                dest = util.sanitize_path(self.__replace_vars(dest))
+                dest = _resolve_dest(dest)
             except Exception as e:
-                log.info(
-                    "%s in <%s> for %s" % (str(e), config.TAG_DESTPATH, target_name)
-                )
+                log.info("%s in <%s> for %s", e, config.TAG_DESTPATH, target_name)
                 return False
 
             # relative path to the source file
@@ -368,9 +490,7 @@ class Distributor(GitRepo):
 
             # make sure file exists
             if not os.path.exists(source_path):
-                log.info(
-                    "Target %s: Source '%s' does not exist" % (target_name, source)
-                )
+                log.info("Target %s: Source '%s' does not exist", target_name, source)
                 return False
 
             # check if file has uncommitted changes
@@ -381,28 +501,20 @@ class Distributor(GitRepo):
             ):
                 log.info(
                     "Target %s: Source '%s' has uncommitted changes.  "
-                    "Commit the changes or use --force." % (target_name, source)
+                    "Commit the changes or use --force.",
+                    target_name,
+                    source,
                 )
                 return False
 
-            # create destination directory if it does not exist (or exit)
+            # collect destination directories that do not exist
             dest_dir = os.path.dirname(dest)
-            if not show and not dryrun and not os.path.exists(dest_dir):
-                question = (
-                    "Target %s: Destination directory '%s' does not "
-                    "exist, create it now?" % (target_name, dest_dir)
-                )
-                if not yes and not util.yesNo(question):
-                    return False
-                try:
-                    os.makedirs(dest_dir)
-                except Exception as e:
-                    log.info(
-                        "ERROR: Failed to create directory '%s': %s"
-                        % (dest_dir, str(e))
-                    )
-                    return False
-            targets.append((source, dest))
+            if not show and not dryrun and dest_dir not in dest_dirs:
+                dest_dirs.add(dest_dir)
+                if not os.path.exists(dest_dir):
+                    missing_dirs.append(dest_dir)
+            versions_dir = dest_dir + "/" + config.DIR_VERSIONS
+            targets.append((source, dest, versions_dir))
 
         if not targets:
             if target:
@@ -416,11 +528,34 @@ class Distributor(GitRepo):
         if not show and not force and self.is_git_behind():
             return False
 
+        # create missing destination directories (or exit)
+        if missing_dirs:
+            question = "Destination directories do not exist:\n%s\nCreate them now?" % (
+                "\n".join("  %s" % d for d in missing_dirs)
+            )
+            if not yes and not util.yesNo(question):
+                return False
+            for dest_dir in missing_dirs:
+                try:
+                    os.makedirs(dest_dir, exist_ok=True)
+                except Exception as e:
+                    log.info("ERROR: Failed to create directory '%s': %s", dest_dir, e)
+                    return False
+
         if dryrun:
             log.info(config.DRYRUN_MESSAGE)
 
+        # create versions directories once, targets may share the same parent
+        if not dryrun and not show:
+            versions_dirs = set(versions_dir for _, _, versions_dir in targets)
+            for versions_dir in versions_dirs:
+                os.makedirs(versions_dir, exist_ok=True)
+
+        # cache of commits looked up when showing versions
+        commits = {}
+
         # process targets listed in dist file
-        for source, dest in targets:
+        for source, dest, versions_dir in targets:
             util.create_dest_folder(dest, dryrun, yes)
 
             # write the dist info file
@@ -436,37 +571,44 @@ class Distributor(GitRepo):
             # define dist version information
             version_num = 0
             version_file = ""
-            version_list = self.__get_file_versions(dest)
+            version_list = self.__get_file_versions(dest, versions_dir)
 
             # TODO: make show a separate method
             if show:
                 if callable(getattr(os, "readlink", None)):
                     if not os.path.lexists(dest):
-                        log.info("Missing: %s" % dest)
+                        log.info("Missing: %s", dest)
+                    elif os.path.islink(dest):
+                        log.info("%s => %s:", source, os.readlink(dest))
                     else:
-                        log.info("%s => %s:" % (source, os.readlink(dest)))
+                        log.info("%s:", source)
                 else:
-                    log.info("%s:" % source)
+                    log.info("%s:", source)
 
                 for version_file, version_num, version_commit in version_list:
                     log.info(
-                        "%s: %s - %s"
-                        % (
-                            version_num,
-                            version_file,
-                            time.ctime(os.path.getmtime(version_file)),
-                        )
+                        "%s: %s - %s",
+                        version_num,
+                        version_file,
+                        time.ctime(os.path.getmtime(version_file)),
                     )
                     if self.repo and verbose:
-                        try:
-                            commit = self.repo.commit(version_commit)
-                            log.info("    %s" % commit.message.strip())
+                        # targets disted together share commits, look up once
+                        if version_commit not in commits:
+                            try:
+                                commits[version_commit] = self.repo.commit(
+                                    version_commit
+                                )
+                            except Exception:
+                                commits[version_commit] = None
+                        commit = commits[version_commit]
+                        if commit:
+                            log.info("    %s", commit.message.strip())
                             log.info(
-                                "    %s - %s"
-                                % (time.ctime(commit.committed_date), commit.author)
+                                "    %s - %s",
+                                time.ctime(commit.committed_date),
+                                commit.author,
                             )
-                        except Exception:
-                            pass
                 continue
 
             # relative path to the source file
@@ -481,8 +623,7 @@ class Distributor(GitRepo):
                     target_type = util.get_path_type(source_path)[0]
                     if os.path.exists(dest) and os.path.lexists(dest):
                         log.info(
-                            "Unchanged: %s =%s> %s"
-                            % (source, target_type, version_file)
+                            "Unchanged: %s =%s> %s", source, target_type, version_file
                         )
                     else:
                         question = (
@@ -492,8 +633,10 @@ class Distributor(GitRepo):
                         if yes or util.yesNo(question):
                             if dryrun:
                                 log.info(
-                                    "Fixed: %s =%s> %s"
-                                    % (source, target_type, version_file)
+                                    "Fixed: %s =%s> %s",
+                                    source,
+                                    target_type,
+                                    version_file,
                                 )
                             else:
                                 if os.path.lexists(dest):
@@ -504,29 +647,27 @@ class Distributor(GitRepo):
                                     + os.path.basename(version_file),
                                     dest,
                                     version_file,
+                                    hardlink=True,
                                 )
                                 if link_created:
                                     log.info(
-                                        "Fixed: %s =%s> %s"
-                                        % (
-                                            source,
-                                            target_type,
-                                            version_file,
-                                        )
+                                        "Fixed: %s =%s> %s",
+                                        source,
+                                        target_type,
+                                        version_file,
                                     )
                                 else:
                                     log.warning(
-                                        "Failed to fix: %s =%s> %s"
-                                        % (source, target_type, dest)
+                                        "Failed to fix: %s =%s> %s",
+                                        source,
+                                        target_type,
+                                        dest,
                                     )
                     continue
 
                 version_num += 1
 
             # copy source file to the versioned destination
-            versions_dir = os.path.dirname(dest) + "/" + config.DIR_VERSIONS
-            if not dryrun and not os.path.exists(versions_dir):
-                os.mkdir(versions_dir)
             version_dest = (
                 versions_dir + "/" + os.path.basename(dest) + "." + str(version_num)
             )
@@ -542,25 +683,25 @@ class Distributor(GitRepo):
             # copy the file/directory to the versioned location
             if not dryrun:
                 self.__copy_object(source_path, version_dest)
+                _list_versions_dir.cache_clear()
             # delete existing symbolic link if it exists
             if not dryrun and os.path.lexists(dest):
                 util.remove_object(dest)
             target_type = util.get_path_type(source)[0]
             # create the new symbolic link
             if dryrun and not versiononly:
-                log.info("Updated: %s =%s> %s" % (source, target_type, version_dest))
+                log.info("Updated: %s =%s> %s", source, target_type, version_dest)
             elif not versiononly:
                 link_created = self.__link_object(
                     config.DIR_VERSIONS + os.path.sep + os.path.basename(version_dest),
                     dest,
                     version_dest,
+                    hardlink=True,
                 )
                 if link_created:
-                    log.info(
-                        "Updated: %s =%s> %s" % (source, target_type, version_dest)
-                    )
+                    log.info("Updated: %s =%s> %s", source, target_type, version_dest)
                 else:
-                    log.warning("Failed to update: %s => %s" % (source, dest))
+                    log.warning("Failed to update: %s => %s", source, dest)
 
         if self.repo:
             try:
@@ -577,41 +718,28 @@ class Distributor(GitRepo):
         :param dryrun: Perform dry run.
         :return: True on success, False on failure.
         """
-        targets_node = self.get_targets()
+        dist_targets = self.__get_dist_targets()
 
-        if targets_node is None:
+        if dist_targets is None:
             return False
 
         if dryrun:
             log.info(config.DRYRUN_MESSAGE)
 
         any_found = False
-        for target_name, target_dict in targets_node.items():
-            if (
-                target_dict.get(config.TAG_SOURCEPATH) is None
-                or target_dict.get(config.TAG_DESTPATH) is None
-            ):
-                continue
-            source = util.normalize_path(target_dict.get(config.TAG_SOURCEPATH))
-            try:
-                dest = util.sanitize_path(
-                    self.__replace_vars(target_dict.get(config.TAG_DESTPATH))
-                )
-            except Exception as e:
-                log.info(
-                    "%s in <%s> for %s" % (str(e), config.TAG_DESTPATH, target_name)
-                )
-                return False
-
+        for target_name, source, dest in dist_targets:
             if target and target != target_name:
                 continue
 
+            dest = self.__resolve_target_dest(target_name, dest)
+            if dest is None:
+                return False
+
             any_found = True
             version_list = self.__get_file_versions(dest)
             if not version_list:
                 log.info(
-                    "Target %s: No versioned files found for '%s'"
-                    % (target_name, source)
+                    "Target %s: No versioned files found for '%s'", target_name, source
                 )
             else:
                 verfile = version_list[-1][0]
@@ -621,15 +749,16 @@ class Distributor(GitRepo):
                 target_type = util.get_path_type(verfile)[0]
                 # create new link to point to requested file
                 if dryrun:
-                    log.info("%s =%s> %s" % (source, target_type, verfile))
+                    log.info("%s =%s> %s", source, target_type, verfile)
                 else:
                     link_created = self.__link_object(
                         config.DIR_VERSIONS + os.path.sep + os.path.basename(verfile),
                         dest,
                         verfile,
+                        hardlink=True,
                     )
                     if link_created:
-                        log.info("%s =%s> %s" % (source, target_type, verfile))
+                        log.info("%s =%s> %s", source, target_type, verfile)
 
         if not any_found:
             log.info("No targets found to reset")
@@ -645,41 +774,27 @@ class Distributor(GitRepo):
         :param dryrun: Perform dry run.
         :return: True on success, False on failure.
         """
-        targets_node = self.get_targets()
+        dist_targets = self.__get_dist_targets()
 
-        if targets_node is None:
+        if dist_targets is None:
             return False
 
         if dryrun:
             log.info(config.DRYRUN_MESSAGE)
 
         any_found = False
-        for target_name, target_dict in targets_node.items():
-            if (
-                target_dict.get(config.TAG_SOURCEPATH) is None
-                or target_dict.get(config.TAG_DESTPATH) is None
-            ):
+        for target_name, source, dest in dist_targets:
+            if target and target != target_name:
                 continue
 
-            source = util.normalize_path(target_dict.get(config.TAG_SOURCEPATH))
-            try:
-                dest = util.sanitize_path(
-                    self.__replace_vars(target_dict.get(config.TAG_DESTPATH))
-                )
-            except Exception as e:
-                log.error(
-                    "%s in <%s> for %s" % (str(e), config.TAG_DESTPATH, target_name)
-                )
+            dest = self.__resolve_target_dest(target_name, dest, log.error)
+            if dest is None:
                 return False
 
-            if target and target != target_name:
-                continue
-
             version_list = self.__get_file_versions(dest)
             if not version_list:
                 log.info(
-                    "Target %s: No versioned files found for '%s'"
-                    % (target_name, source)
+                    "Target %s: No versioned files found for '%s'", target_name, source
                 )
                 continue
             any_found_this_target = False
@@ -688,8 +803,10 @@ class Distributor(GitRepo):
                 if abs(target_version) > len(version_list) - 1:
                     log.warning(
                         "Requested to roll back %d versions but there "
-                        "are only %d previous versions for %s"
-                        % (abs(target_version), len(version_list) - 1, source)
+                        "are only %d previous versions for %s",
+                        abs(target_version),
+                        len(version_list) - 1,
+                        source,
                     )
                     continue
                 target_version = version_list[target_version - 1][1]
@@ -707,7 +824,7 @@ class Distributor(GitRepo):
                     target_type = util.get_path_type(verfile)[0]
                     # create new symbolic link to point to requested versioned file
                     if dryrun:
-                        log.info("%s =%s> %s" % (source, target_type, verfile))
+                        log.info("%s =%s> %s", source, target_type, verfile)
                     else:
                         link_created = self.__link_object(
                             config.DIR_VERSIONS
@@ -715,21 +832,24 @@ class Distributor(GitRepo):
                             + os.path.basename(verfile),
                             dest,
                             verfile,
+                            hardlink=True,
                         )
                         if link_created:
-                            log.info("%s =%s> %s" % (source, target_type, verfile))
+                            log.info("%s =%s> %s", source, target_type, verfile)
                     break
 
             if not any_found_this_target:
                 if target_commit:
                     log.info(
-                        "Target commit %s not found for target %s"
-                        % (target_commit, target_name)
+                        "Target commit %s not found for target %s",
+                        target_commit,
+                        target_name,
                     )
                 else:
                     log.info(
-                        "Target version %d not found for target %s"
-                        % (target_version, target_name)
+                        "Target version %d not found for target %s",
+                        target_version,
+                        target_name,
                     )
 
         if not any_found:
@@ -746,59 +866,57 @@ class Distributor(GitRepo):
         :param dryrun: Perform dry run.
         :return: True on success, False on failure.
         """
-        targets_node = self.get_targets()
+        dist_targets = self.__get_dist_targets()
 
-        if targets_node is None:
+        if dist_targets is None:
             return False
 
         if dryrun:
             log.info(config.DRYRUN_MESSAGE)
 
         any_found = False
-        for target_name, target_dict in targets_node.items():
-            if (
-                target_dict.get(config.TAG_SOURCEPATH) is not None
-                and target_dict.get(config.TAG_DESTPATH) is not None
-            ):
-                if target and target != target_name:
-                    continue
+        for target_name, source, dest in dist_targets:
+            if target and target != target_name:
+                continue
 
-                source = util.normalize_path(target_dict.get(config.TAG_SOURCEPATH))
-                try:
-                    dest = util.sanitize_path(
-                        self.__replace_vars(target_dict.get(config.TAG_DESTPATH))
-                    )
-                except Exception as e:
-                    log.info(
-                        "%s in <%s> for %s" % (str(e), config.TAG_DESTPATH, target_name)
-                    )
-                    return False
-                version_list = self.__get_file_versions(dest)
-                question = "Delete target '%s' (%s => %s) and %d versions?" % (
-                    target_name,
-                    source,
-                    dest,
-                    len(version_list),
-                )
-                if yes or dryrun or util.yesNo(question):
-                    any_found = True
-                    distinfo = util.get_dist_info(dest=dest)
-                    if os.path.lexists(dest):
-                        log.info("Deleting: %s" % dest)
-                        if not dryrun:
-                            util.remove_object(dest)
-                    else:
-                        log.info("Missing: %s" % dest)
-                    if os.path.lexists(distinfo):
-                        log.info("Deleting: %s" % distinfo)
-                        if not dryrun:
-                            os.remove(distinfo)
-                    else:
-                        log.info("Missing: %s" % distinfo)
-                    for verFile, _, _ in version_list:
-                        log.info("Deleting: %s" % verFile)
-                        if not dryrun:
-                            util.remove_object(verFile, recurse=True)
+            dest = self.__resolve_target_dest(target_name, dest)
+            if dest is None:
+                return False
+
+            version_list = self.__get_file_versions(dest)
+            question = "Delete target '%s' (%s => %s) and %d versions?" % (
+                target_name,
+                source,
+                dest,
+                len(version_list),
+            )
+            if yes or dryrun or util.yesNo(question):
+                any_found = True
+                distinfo = util.get_dist_info(dest=dest)
+                if os.path.lexists(dest):
+                    log.info("Deleting: %s", dest)
+                    if not dryrun:
+                        util.remove_object(dest)
+                else:
+                    log.info("Missing: %s", dest)
+                if os.path.lexists(distinfo):
+                    log.info("Deleting: %s", distinfo)
+                    if not dryrun:
+                        os.remove(distinfo)
+                else:
+                    log.info("Missing: %s", distinfo)
+                for verFile, _, _ in version_list:
+                    log.info("Deleting: %s", verFile)
+                # remove versions in parallel, they are independent
+                if version_list and not dryrun:
+                    with ThreadPoolExecutor(config.MAX_WORKERS) as executor:
+                        list(
+                            executor.map(
+                                functools.partial(util.remove_object, recurse=True),
+                                [verFile for verFile, _, _ in version_list],
+                            )
+                        )
+                    _list_versions_dir.cache_clear()
 
         if not any_found:
             log.info("No targets found to delete")
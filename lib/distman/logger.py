@@ -35,19 +35,57 @@ Contains logging functions and classes.
 
 import logging
 
-from distman.config import LOG_LEVEL
+from distman import config
 
-log = logging.Logger("distman")
+# normalizes level names and numeric strings to the names logging accepts,
+# including aliases such as WARN and FATAL
+_LEVELS = (
+    logging.CRITICAL,
+    logging.ERROR,
+    logging.WARNING,
+    logging.INFO,
+    logging.DEBUG,
+    logging.NOTSET,
+)
+_LEVEL_NORMALIZE = {
+    **{logging.getLevelName(n): logging.getLevelName(n) for n in _LEVELS},
+    **{str(n): logging.getLevelName(n) for n in _LEVELS},
+    "FATAL": logging.getLevelName(logging.FATAL),
+    "WARN": logging.getLevelName(logging.WARN),
+}
+
+
+def is_valid_level(level):
+    """Returns True if level is a known log level name or number.
+
+    :param level: Log level name or number.
+    :returns: True if level is valid.
+    """
+    return str(level).upper() in _LEVEL_NORMALIZE
+
+
+LOG_LEVEL = _LEVEL_NORMALIZE.get(
+    str(config.LOG_LEVEL).upper(), config.LOG_LEVEL_DEFAULT
+)
+
+# formatter shared by stream handlers
+_STREAM_FORMATTER = logging.Formatter("%(message)s")
+
+log = logging.getLogger("distman")
 log.setLevel(LOG_LEVEL)
+log.propagate = False
 log.addHandler(logging.NullHandler())
 
 
 def setup_stream_handler():
     """Adds a new stdout stream handler."""
-    for h in log.handlers:
-        if h.name == log.name and "StreamHandler" in str(h):
-            del log.handlers[log.handlers.index(h)]
+    # FileHandler subclasses StreamHandler, so match the exact type
+    log.handlers = [
+        h
+        for h in log.handlers
+        if not (h.name == log.name and type(h) is logging.StreamHandler)
+    ]
     stream_hanlder = logging.StreamHandler()
     stream_hanlder.set_name(log.name)
-    stream_hanlder.setFormatter(logging.Formatter("%(message)s"))
+    stream_hanlder.setFormatter(_STREAM_FORMATTER)
     log.addHandler(stream_hanlder)
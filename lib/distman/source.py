@@ -33,12 +33,17 @@ __doc__ = """
 Contains source file distribution classes and functions.
 """
 
-import json
+import logging
 import os
-from pathlib import Path
 
 import git
 
+# use the faster orjson parser when it is installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 from distman import config, util
 from distman.logger import log
 
@@ -90,27 +95,38 @@ class Source(object):
         self.directory = directory
 
         try:
-            with open(dist_file, "r") as jsonFile:
-                json_data = json.load(jsonFile)
+            with open(dist_file, "rb") as jsonFile:
+                json_data = json_loads(jsonFile.read())
         except Exception as e:
-            log.error("Failed to parse dist file: %s", str(e))
+            log.error("Failed to parse dist file: %s", e)
             return False
 
         self.root = json_data
         self.author = self.root.get(config.TAG_AUTHOR, util.get_user())
 
-        log.info("Author: %s" % self.author)
+        log.info("Author: %s", self.author)
         if config.TAG_VERSION in self.root:
-            self.dist_file_version = self.root[config.TAG_VERSION]
-            if int(self.dist_file_version) < config.DIST_FILE_VERSION:
+            try:
+                self.dist_file_version = int(self.root[config.TAG_VERSION])
+            except (TypeError, ValueError):
+                log.error(
+                    "ERROR: Invalid dist file version: %s",
+                    self.root[config.TAG_VERSION],
+                )
+                self.root = None
+                return False
+            if self.dist_file_version < config.DIST_FILE_VERSION:
                 log.warning(
-                    "WARNING: Old dist file version: %s (current %d)"
-                    % (self.dist_file_version, config.DIST_FILE_VERSION)
+                    "WARNING: Old dist file version: %s (current %d)",
+                    self.dist_file_version,
+                    config.DIST_FILE_VERSION,
                 )
-            elif int(self.dist_file_version) > config.DIST_FILE_VERSION:
+            elif self.dist_file_version > config.DIST_FILE_VERSION:
                 log.error(
                     "ERROR: This dist file is newer than this script version: %s "
-                    "(currrent %d)" % (self.dist_file_version, config.DIST_FILE_VERSION)
+                    "(currrent %d)",
+                    self.dist_file_version,
+                    config.DIST_FILE_VERSION,
                 )
                 self.root = None
                 return False
@@ -127,32 +143,55 @@ class GitRepo(Source):
         self.head = ""
         self.repo = None
         self.short_head = ""
+        self.__repo_files = {}
 
     @requires_git
     def get_repo_files(self, start="."):
-        """Generator that yields relative file paths tracked by this git repo.
+        """Returns relative file paths tracked by this git repo at HEAD. The
+        HEAD tree is listed once with `git ls-tree` and filtered by start.
 
         :param start: Starting directory.
         :return: List of relative file paths.
         """
-        repo_root = Path(self.repo.working_tree_dir).resolve()
+        if not self.repo:
+            return []
+
+        repo_root = os.path.realpath(self.repo.working_tree_dir)
 
         # resolve the start directory relative to the repo root
-        start_path = (repo_root / start).resolve()
-        if not start_path.is_dir():
+        start_path = os.path.realpath(os.path.join(repo_root, start))
+        if not os.path.isdir(start_path):
             raise ValueError(
                 f"Start directory '{start}' does not exist or is not a directory."
             )
 
-        # get the list of tracked files and filter by start_dir
-        tracked_files = []
-        for item in self.repo.tree().traverse():
-            item_path = repo_root / item.path
-            if item_path.is_file() and start_path in item_path.parents:
-                # append relative path from the repo root
-                tracked_files.append(str(item_path.relative_to(repo_root)))
+        # list every file in the HEAD tree once per HEAD, tracked files only
+        # change when HEAD does
+        if self.head not in self.__repo_files:
+            try:
+                output = self.repo.git.ls_tree("-r", "-z", "HEAD")
+            except git.GitCommandError as e:
+                log.error("Error listing repo files: %s", e)
+                return []
+
+            # records are "<mode> <type> <object>\t<path>", keep blobs only so
+            # submodule commits are left out
+            records = (record.partition("\t") for record in output.split("\0"))
+            self.__repo_files[self.head] = [
+                path
+                for info, _, path in records
+                if path and info.split(" ")[1] == "blob"
+            ]
+
+        tracked_files = self.__repo_files[self.head]
+
+        # filter by start directory, git paths are relative to the repo root
+        prefix = os.path.relpath(start_path, repo_root).replace(os.sep, "/")
+        if prefix == ".":
+            return list(tracked_files)
 
-        return tracked_files
+        prefix += "/"
+        return [f for f in tracked_files if f.startswith(prefix)]
 
     @requires_git
     def get_untracked_files(self, start=".", include_ignored=True):
@@ -167,18 +206,66 @@ class GitRepo(Source):
         untracked_files = []
         untracked_dirs = []
 
-        all_files = [util.normalize_path(f) for f in util.walk(start)]
+        if not self.repo:
+            return untracked_files, untracked_dirs
 
         if include_ignored:
-            repo_files = [util.normalize_path(f) for f in self.get_repo_files(start)]
-            untracked_files = [f for f in all_files if f not in repo_files]
+            try:
+                untracked_files = self.__git_untracked_files(start)
+            except git.GitCommandError as e:
+                log.warning("Warning: git status failed, walking files: %s", e)
+                all_files = list(map(util.normalize_path, util.walk(start)))
+                repo_files = set(map(util.normalize_path, self.get_repo_files(start)))
+                untracked_files = [f for f in all_files if f not in repo_files]
         else:
-            untracked_files = [f for f in self.repo.untracked_files]
+            output = self.repo.git.ls_files(
+                "--others", "--exclude-standard", "-z", "--", start
+            )
+            untracked_files = [f for f in output.split("\0") if f]
 
         untracked_dirs = util.get_common_root_dirs(untracked_files)
 
         return untracked_files, untracked_dirs
 
+    def __git_untracked_files(self, start):
+        """Returns files under start that are not in the HEAD tree, including
+        ignored files, as reported by a single `git status` call.
+
+        :param start: Starting directory.
+        :return: List of relative file paths.
+        """
+        output = self.repo.git.status(
+            "--porcelain=v1", "-z", "--ignored", "--untracked-files=all", "--", start
+        )
+
+        untracked_files = []
+        records = iter(output.split("\0"))
+        for record in records:
+            if not record:
+                continue
+            status, path = record[:2], record[3:]
+            # renames and copies are followed by the original path
+            if "R" in status or "C" in status:
+                next(records)
+            # untracked, ignored, intent-to-add, or staged but not yet in HEAD
+            if (
+                status not in ("??", "!!")
+                and status[1] != "A"
+                and (status[0] not in "ARC" or status[1] == "D")
+            ):
+                continue
+            if any(util.is_ignorable(p) for p in path.rstrip("/").split("/")):
+                continue
+            # nested repos are reported as a single directory entry
+            if path.endswith("/"):
+                untracked_files.extend(
+                    map(util.normalize_path, util.walk(path.rstrip("/")))
+                )
+                continue
+            untracked_files.append(util.normalize_path(path))
+
+        return untracked_files
+
     def get_path(self):
         """Get the git repo path for the dist info file."""
         if self.repo and self.repo.remotes:
@@ -188,17 +275,33 @@ class GitRepo(Source):
                 return self.repo.remotes[0].url
         return self.path
 
+    def __enable_untracked_cache(self):
+        """Turns on git's untracked cache for this repo, unless the repo
+        already sets core.untrackedCache.
+        """
+        try:
+            if self.repo.config_reader().has_option("core", "untrackedCache"):
+                return
+            self.repo.git.update_index("--untracked-cache")
+            with self.repo.config_writer() as writer:
+                writer.set_value("core", "untrackedCache", "true")
+        except Exception as e:
+            log.warning("Warning: Could not enable untracked cache: %s", e)
+
     def read_git_info(self):
         """Read git repo information."""
         self.branch_name = ""
         self.head = ""
         self.short_head = ""
+        self.__repo_files.clear()
         self.path = os.getcwd().replace("\\", "/")
         self.name = os.path.basename(self.path)
         self.changed_files = []
 
         try:
             self.repo = git.Repo(self.directory)
+            if config.ENABLE_UNTRACKED_CACHE:
+                self.__enable_untracked_cache()
             self.head = self.repo.head.commit.hexsha
             self.short_head = self.head[: config.LEN_HASH]
             self.path = self.get_path()
@@ -224,17 +327,21 @@ class GitRepo(Source):
             self.repo = False
 
         except (AttributeError, TypeError) as e:
-            log.warning("Warning: %s", str(e))
+            log.warning("Warning: %s", e)
 
         except Exception as e:
-            log.warning("Error reading git repo: %s", str(e))
+            log.warning("Error reading git repo: %s", e)
+            # don't try to open the repo again on every requires_git call
+            if self.repo is None:
+                self.repo = False
 
-        log.info("Name: %s" % self.name)
-        log.info("Path: %s" % self.path)
+        if log.isEnabledFor(logging.INFO):
+            log.info("Name: %s", self.name)
+            log.info("Path: %s", self.path)
 
-        if self.repo and self.branch_name:
-            log.info("Branch: %s" % self.branch_name)
-            log.info("Head: %s (%s)" % (self.head, self.short_head))
+            if self.repo and self.branch_name:
+                log.info("Branch: %s", self.branch_name)
+                log.info("Head: %s (%s)", self.head, self.short_head)
 
         return True
 
@@ -247,20 +354,31 @@ class GitRepo(Source):
         if not self.repo.remotes:
             return False
 
+        # nothing to compare against when the branch has no upstream
         try:
-            upstream_commits = list(
-                self.repo.iter_commits(f"origin/{self.branch_name}..{self.branch_name}")
+            upstream = self.repo.active_branch.tracking_branch()
+        except (TypeError, ValueError):
+            upstream = None
+        if upstream is None:
+            log.debug("No upstream branch for %s", self.branch_name)
+            return False
+
+        try:
+            behind = int(
+                self.repo.git.rev_list(
+                    "--count", f"{upstream.name}..{self.branch_name}"
+                )
             )
-            if upstream_commits:
+            if behind:
                 log.error(
                     "Directory is %d commits behind remote repository. "
-                    "Run: git pull from origin first or use --force."
-                    % len(upstream_commits)
+                    "Run: git pull from origin first or use --force.",
+                    behind,
                 )
                 return True
 
         except Exception as err:
-            log.error("Error checking remote branch: %s", str(err))
+            log.error("Error checking remote branch: %s", err)
             return True
 
         return False
@@ -276,28 +394,27 @@ class GitRepo(Source):
         if not self.repo:
             return []
 
-        try:
-            # get list of changed files
-            changed_files = [
-                os.path.join(self.directory, item.a_path)
-                for item in self.repo.index.diff(None)
-            ]
+        untracked = "all" if include_untracked else "no"
 
-            # get list of staged files
-            changed_files += [
-                os.path.join(self.directory, item.a_path)
-                for item in self.repo.index.diff("HEAD")
-            ]
+        try:
+            # get modified, staged and untracked (excluding ignored) files
+            output = self.repo.git.status(
+                "--porcelain=v1", "-z", f"--untracked-files={untracked}"
+            )
 
-            # get list of untracked files (excluding ignored)
-            if include_untracked:
-                changed_files += [
-                    os.path.join(self.directory, item)
-                    for item in self.repo.untracked_files
-                ]
+            changed_files = []
+            records = iter(output.split("\0"))
+            for record in records:
+                if not record:
+                    continue
+                status, path = record[:2], record[3:]
+                changed_files.append(os.path.join(self.directory, path))
+                # renames and copies are followed by the original path
+                if "R" in status or "C" in status:
+                    changed_files.append(os.path.join(self.directory, next(records)))
 
-            return [util.normalize_path(f) for f in changed_files]
+            return list(map(util.normalize_path, changed_files))
 
         except Exception as e:
-            log.error("Error getting changed files: %s", str(e))
+            log.error("Error getting changed files: %s", e)
             return []
@@ -34,10 +34,13 @@ Contains utility functions and classes.
 """
 
 import ctypes
+import errno
 import fnmatch
+import functools
 import os
 import re
 import shutil
+import stat
 from collections import defaultdict
 
 from distman import config
@@ -45,7 +48,17 @@ from distman.logger import log
 
 # cache regex pattern that matches any patterns in IGNORABLE
 IGNORABLE_PATHS = re.compile(
-    "(" + ")|(".join([fnmatch.translate(i) for i in config.IGNORABLE]) + ")"
+    "(?:" + ")|(?:".join([fnmatch.translate(i) for i in config.IGNORABLE]) + ")"
+)
+
+# matches a path token, e.g. {DEPLOY_ROOT}, capturing the variable name
+PATH_TOKEN = re.compile(
+    "%s([^%s]*)%s"
+    % (
+        re.escape(config.PATH_TOKEN_OPEN),
+        re.escape(config.PATH_TOKEN_CLOSE),
+        re.escape(config.PATH_TOKEN_CLOSE),
+    )
 )
 
 
@@ -125,8 +138,22 @@ def is_file_hidden(filepath):
     :param filepath: file system path.
     :returns: True if file is hidden.
     """
-    name = os.path.basename(os.path.abspath(filepath))
-    return name.startswith(".") or has_hidden_attr(filepath)
+    name = os.path.basename(filepath)
+    # only ".", ".." and trailing separators need resolving to get the name
+    if not name or name in (".", ".."):
+        name = os.path.basename(os.path.abspath(filepath))
+    if name.startswith("."):
+        return True
+    return os.name == "nt" and has_hidden_attr(filepath)
+
+
+def has_binary_extension(filepath):
+    """Returns True if the file extension is a known binary file type.
+
+    :param filepath: file system path.
+    :returns: True if file has a binary extension.
+    """
+    return os.path.splitext(filepath)[1].lower() in config.BINARY_EXTENSIONS
 
 
 def is_ignorable(filepath):
@@ -140,7 +167,18 @@ def is_ignorable(filepath):
     if is_file_hidden(filepath):
         return True
 
-    return re.search(IGNORABLE_PATHS, filepath) is not None
+    return _matches_ignorable(filepath)
+
+
+@functools.lru_cache(maxsize=4096)
+def _matches_ignorable(filepath):
+    """Returns True if filepath matches the ignorable patterns. Cached, as the
+    same file and directory names recur throughout a walk.
+
+    :param filepath: file system path.
+    :returns: True if filepath matches an ignorable pattern.
+    """
+    return IGNORABLE_PATHS.search(filepath) is not None
 
 
 def get_root_dir(path):
@@ -182,11 +220,16 @@ def get_path_type(path):
     :returns: name of path type as a string.
     """
 
-    if os.path.islink(path):
+    try:
+        mode = os.lstat(path).st_mode
+    except (OSError, ValueError):
+        return "null"
+
+    if stat.S_ISLNK(mode):
         target_type = "link"
-    elif os.path.isdir(path):
+    elif stat.S_ISDIR(mode):
         target_type = "directory"
-    elif os.path.isfile(path):
+    elif stat.S_ISREG(mode):
         target_type = "file"
     else:
         target_type = "null"
@@ -223,6 +266,33 @@ def sanitize_path(path):
     return path
 
 
+def _resolve_var(match):
+    """Returns the env var or config default value for a path token match.
+
+    :param match: PATH_TOKEN match object.
+    :return: Variable value.
+    """
+    var = match.group(1).upper()
+    replacement = os.getenv(var, config.DEFAULT_ENV.get(var))
+    if not replacement:
+        raise Exception("Cannot resolve env var '%s'" % var)
+    return replacement
+
+
+def replace_vars(pathstr):
+    """Replaces tokens in string with environment variable or config default.
+    Values that contain tokens themselves are expanded in turn.
+
+    :param pathstr: Path string with tokens.
+    :return: Path string with tokens replaced.
+    """
+    while True:
+        replaced = PATH_TOKEN.sub(_resolve_var, pathstr)
+        if replaced == pathstr:
+            return pathstr
+        pathstr = replaced
+
+
 def get_dist_info(dest, ext=config.DIST_INFO_EXT):
     """Returns the dist info file path, e.g.
 
@@ -245,7 +315,7 @@ def write_dist_info(dest, dist_info):
     :param dist_info: Dictionary of distribution information.
     """
     distinfo = get_dist_info(dest=dest)
-    log.debug("Writing dist info to %s" % distinfo)
+    log.debug("Writing dist info to %s", distinfo)
     with open(distinfo, "w") as outFile:
         for key, value in dist_info.items():
             outFile.write(f"{key}: {value}\n")
@@ -262,17 +332,15 @@ def create_dest_folder(dest, dryrun=False, yes=False):
     dest_dir = os.path.dirname(dest)
 
     if not os.path.exists(dest_dir):
-        log.info("Creating destination directory '%s'" % dest_dir)
+        log.info("Creating destination directory '%s'", dest_dir)
         if not dryrun:
             try:
                 os.makedirs(dest_dir)
             except Exception as e:
-                log.info(
-                    "ERROR: Failed to create directory '%s': %s" % (dest_dir, str(e))
-                )
+                log.info("ERROR: Failed to create directory '%s': %s", dest_dir, e)
                 return False
     elif not os.path.isdir(dest_dir):
-        log.info("Directory not found: %s" % dest_dir)
+        log.info("Directory not found: %s", dest_dir)
         return False
 
     # if dist info file does not exist means this is a new target
@@ -286,7 +354,78 @@ def create_dest_folder(dest, dryrun=False, yes=False):
             )
             if not yes and not yesNo(question):
                 return False
-        log.info("Initializing: %s" % dest)
+        log.info("Initializing: %s", dest)
+
+
+def copy_file(source, dest):
+    """Copies a file and its metadata. Uses os.copy_file_range where available
+    so data is copied in the kernel (or cloned on filesystems that support
+    it), falling back to shutil.copyfile when the filesystem does not.
+
+    :param source: path to source file.
+    :param dest: path to destination file.
+    """
+    copy_file_range = getattr(os, "copy_file_range", None)
+
+    if copy_file_range is None:
+        shutil.copy2(source, dest)
+        return
+
+    try:
+        with open(source, "rb") as infile, open(dest, "wb") as outfile:
+            infd, outfd = infile.fileno(), outfile.fileno()
+            size = os.fstat(infd).st_size
+            copied = 0
+            while True:
+                count = copy_file_range(infd, outfd, 1 << 30)
+                if count <= 0:
+                    break
+                copied += count
+        # some filesystems (e.g. procfs, some fuse mounts) report zero bytes
+        # copied without raising, so check nothing was left behind
+        complete = copied >= size
+    except OSError as e:
+        if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+            raise
+        complete = False
+
+    if not complete:
+        shutil.copyfile(source, dest)
+
+    shutil.copystat(source, dest)
+
+
+def link_file(source, link):
+    """Creates a hard link to a regular file, atomically replacing any existing
+    file at link. Hard links require source and link to be on the same
+    filesystem.
+
+    :param source: path to source file.
+    :param link: path to the hard link.
+    :returns: True if the hard link was created.
+    """
+    try:
+        source_stat = os.lstat(source)
+        link_dir = os.path.dirname(os.path.abspath(link))
+        if not stat.S_ISREG(source_stat.st_mode):
+            return False
+        if source_stat.st_dev != os.stat(link_dir).st_dev:
+            return False
+    except OSError:
+        return False
+
+    temp_link = "%s.%d.tmp" % (link, os.getpid())
+
+    try:
+        os.link(source, temp_link)
+        os.replace(temp_link, link)
+    except OSError as e:
+        log.debug("Failed to create hard link '%s': %s", link, e)
+        if os.path.lexists(temp_link):
+            os.remove(temp_link)
+        return False
+
+    return True
 
 
 def full_path(start, relative_path):
@@ -341,7 +480,7 @@ def remove_object(path, recurse=False):
             # try to delete as file if fails
             os.remove(path)
         except OSError as e:
-            log.error("Error removing '%s': %s" % (path, str(e)))
+            log.error("Error removing '%s': %s", path, e)
 
 
 def yesNo(question):
@@ -376,15 +515,42 @@ def walk(path, exclude_ignorables=True, followlinks=False):
     """
     if not is_ignorable(path) and os.path.isfile(path):
         yield path
-    for dirname, dirs, files in os.walk(path, topdown=True, followlinks=followlinks):
-        if exclude_ignorables and is_ignorable(dirname):
+
+    # depth first, in the same order as os.walk(topdown=True), but the entry
+    # types come from scandir so no extra stat calls are made per entry
+    stack = [path]
+    while stack:
+        dirname = stack.pop()
+        try:
+            with os.scandir(dirname) as it:
+                entries = list(it)
+        except OSError:
             continue
-        for d in dirs:
-            if exclude_ignorables and is_ignorable(d):
-                dirs.remove(d)
-            # include symlinks to directories
-            elif os.path.islink(os.path.join(dirname, d)):
-                yield os.path.join(dirname, d)
-        for name in files:
-            if not is_ignorable(name):
-                yield os.path.join(dirname, name)
+
+        dirs = []
+        files = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                dirs.append(entry)
+            else:
+                files.append(entry)
+
+        if not (exclude_ignorables and is_ignorable(dirname)):
+            # prune ignorable dirs so they are not descended into
+            if exclude_ignorables:
+                dirs = [d for d in dirs if not is_ignorable(d.name)]
+            for d in dirs:
+                # include symlinks to directories
+                if d.is_symlink():
+                    yield d.path
+            for f in files:
+                if not is_ignorable(f.name):
+                    yield f.path
+
+        stack.extend(
+            d.path for d in reversed(dirs) if followlinks or not d.is_symlink()
+        )